@@ -0,0 +1,40 @@
+"""JSON encode/decode helpers that use ``orjson`` when it is installed.
+
+``orjson`` is an optional dependency (``pip install hatchkit[fast]``); without
+it these fall back to the standard library ``json`` module.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra isn't installed
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from *data*."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: object) -> str:
+    """Serialise *data* as JSON indented by two spaces.
+
+    Non-ASCII text is written as-is rather than ``\\u`` escaped, matching
+    ``orjson`` so the output doesn't depend on which backend is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def dumpb(data: object) -> bytes:
+    """Serialise *data* as UTF-8 encoded JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import os
+import shlex
 import shutil
+import signal
 import subprocess
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from importlib.resources import files
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from hatchkit import __version__
 from hatchkit.pr import pr_app
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
 app = typer.Typer(
     name="hatchkit",
     help="A tool to help with AI driven development.",
@@ -23,7 +34,18 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-console = Console()
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return the shared Rich console, importing Rich's console lazily.
+
+    Rich's console, table and panel modules are only imported by the
+    commands that render them, which keeps ``version`` and ``--help`` fast.
+    """
+    from rich.console import Console
+
+    return Console()
+
 
 app.add_typer(pr_app, name="pr")
 
@@ -60,6 +82,180 @@ def _tool_status(name: str) -> tuple[bool, str]:
     return True, version
 
 
+# Each probe runs as a background subshell and reports a single
+# ``name<TAB>path<TAB>version`` line, so one ``sh`` process covers every tool
+# while the probes still run concurrently.
+_PROBE_SNIPPET = """\
+( path=$(command -v {name}) || path=
+  version=
+  if [ -n "$path" ]; then version=$({name} --version 2>&1 </dev/null | head -n 1); fi
+  printf '%s\\t%s\\t%s\\n' {name} "$path" "$version" ) &
+"""
+
+
+# Seconds to wait for the shell probe before giving up on it.
+_PROBE_TIMEOUT = 10
+
+
+# Versions of found tools are cached on disk keyed on the resolved path and
+# its mtime, so repeat ``check`` runs skip spawning tools that haven't changed.
+TOOL_CACHE_TTL = 24 * 60 * 60
+
+
+def _tool_cache_file() -> Path:
+    """Return the location of the on-disk tool status cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "hatchkit" / "tool_status.json"
+
+
+def _load_tool_cache() -> dict[str, dict]:
+    """Load the tool status cache, returning an empty cache if unreadable."""
+    try:
+        data = json.loads(_tool_cache_file().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_tool_cache(cache: dict[str, dict]) -> None:
+    """Write the tool status cache; failures are ignored since it is only a cache."""
+    cache_file = _tool_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _iter_tool_statuses(
+    names: list[str], *, refresh: bool = False
+) -> Iterator[tuple[str, tuple[bool, str]]]:
+    """Yield ``(name, status)`` for each of *names* as soon as it is known.
+
+    Missing tools and tools whose cached entry is younger than
+    :data:`TOOL_CACHE_TTL` (with an unchanged executable) come first; pass
+    *refresh=True* to ignore the cache. The rest follow in completion order
+    from :func:`_iter_probe_tools`, and the cache is saved once they're done.
+    """
+    cache = {} if refresh else _load_tool_cache()
+    now = time.time()
+    stamps: dict[str, tuple[str, float]] = {}
+    misses: list[str] = []
+
+    for name in names:
+        path = shutil.which(name)
+        if path is None:
+            yield name, (False, "")
+            continue
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            misses.append(name)
+            continue
+        stamps[name] = (path, mtime)
+        entry = cache.get(name)
+        if (
+            isinstance(entry, dict)
+            and entry.get("path") == path
+            and entry.get("path_mtime") == mtime
+            and now - entry.get("cached_at", 0) < TOOL_CACHE_TTL
+        ):
+            yield name, (True, entry["version"])
+        else:
+            misses.append(name)
+
+    if not misses:
+        return
+
+    for name, status in _iter_probe_tools(misses):
+        yield name, status
+        if not status[0] or name not in stamps:
+            continue
+        path, mtime = stamps[name]
+        # The path stands in for the version when ``--version`` printed
+        # nothing, failed or timed out; don't let a slow start stick for a day.
+        if status[1] == path:
+            continue
+        cache[name] = {
+            "path": path,
+            "path_mtime": mtime,
+            "version": status[1],
+            "cached_at": now,
+        }
+    _save_tool_cache(cache)
+
+
+def _iter_probe_tools(names: list[str]) -> Iterator[tuple[str, tuple[bool, str]]]:
+    """Probe *names* for their versions, yielding ``(name, status)`` as each finishes.
+
+    On POSIX all tools are probed from a single ``sh`` invocation; elsewhere,
+    or if the shell can't be started, each tool is probed separately in a thread.
+    """
+    if os.name != "nt":
+        script = "".join(_PROBE_SNIPPET.format(name=shlex.quote(n)) for n in names) + "wait\n"
+        try:
+            proc = subprocess.Popen(
+                ["sh", "-c", script],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                encoding="utf-8",
+                errors="replace",
+                start_new_session=True,
+            )
+        except OSError:
+            pass
+        else:
+            yield from _read_probe_output(proc, names)
+            return
+
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        futures = {executor.submit(_tool_status, name): name for name in names}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _read_probe_output(
+    proc: subprocess.Popen, names: list[str]
+) -> Iterator[tuple[str, tuple[bool, str]]]:
+    """Yield statuses from the ``sh`` probe *proc* as its lines arrive.
+
+    The probe's whole process group is killed after :data:`_PROBE_TIMEOUT`
+    seconds, since the background subshells would otherwise keep the pipe
+    open. Tools it didn't report (usually because their ``--version`` hung)
+    are not probed again; like :func:`_tool_status` when ``--version``
+    fails, they are reported as found with their path.
+    """
+    timer = threading.Timer(_PROBE_TIMEOUT, _kill_process_group, (proc.pid,))
+    timer.start()
+    reported: set[str] = set()
+    try:
+        for line in proc.stdout:
+            name, _, rest = line.rstrip("\n").partition("\t")
+            path, _, version = rest.partition("\t")
+            if name in names and name not in reported:
+                reported.add(name)
+                yield name, ((True, version.strip() or path) if path else (False, ""))
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            _kill_process_group(proc.pid)
+        proc.stdout.close()
+        proc.wait()
+
+    for name in names:
+        if name not in reported:
+            path = shutil.which(name)
+            yield name, ((True, path) if path else (False, ""))
+
+
+def _kill_process_group(pid: int) -> None:
+    """SIGKILL the process group led by *pid*, ignoring groups that already exited."""
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
 def _load_command_templates() -> dict[str, str]:
     """Load all .md command templates from the templates/commands package."""
     commands_pkg = files("hatchkit.templates.commands")
@@ -70,6 +266,27 @@ def _load_command_templates() -> dict[str, str]:
     return templates
 
 
+def _check_table(results: dict[str, tuple[bool, str]]) -> Table:
+    """Build the ``check`` table, showing tools not yet in *results* as pending."""
+    from rich.table import Table
+
+    table = Table(title="Tool Check", show_header=True, header_style="bold magenta")
+    table.add_column("Tool", style="cyan", no_wrap=True)
+    table.add_column("Status", no_wrap=True)
+    table.add_column("Details")
+    table.add_column("Description", style="dim")
+
+    for tool, description in TOOLS_TO_CHECK.items():
+        if tool not in results:
+            table.add_row(tool, "[dim]… checking[/dim]", "", description)
+            continue
+        found, details = results[tool]
+        status = "[green]✔ found[/green]" if found else "[red]✘ missing[/red]"
+        table.add_row(tool, status, details or "–", description)
+
+    return table
+
+
 # ---------------------------------------------------------------------------
 # Commands
 # ---------------------------------------------------------------------------
@@ -82,25 +299,31 @@ def version() -> None:
 
 
 @app.command()
-def check() -> None:
+def check(
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore cached tool versions and probe every tool again.",
+    ),
+) -> None:
     """Check for required tools and AI agents on your system."""
-    table = Table(title="Tool Check", show_header=True, header_style="bold magenta")
-    table.add_column("Tool", style="cyan", no_wrap=True)
-    table.add_column("Status", no_wrap=True)
-    table.add_column("Details")
-    table.add_column("Description", style="dim")
-
-    all_found = True
-    for tool, description in TOOLS_TO_CHECK.items():
-        found, details = _tool_status(tool)
-        if found:
-            status = "[green]✔ found[/green]"
-        else:
-            status = "[red]✘ missing[/red]"
-            all_found = False
-        table.add_row(tool, status, details or "–", description)
+    console = _console()
+    results: dict[str, tuple[bool, str]] = {}
+    statuses = _iter_tool_statuses(list(TOOLS_TO_CHECK), refresh=refresh)
+
+    if console.is_terminal:
+        from rich.live import Live
+
+        # Rows start out pending and fill in as each probe finishes.
+        with Live(_check_table(results), console=console, refresh_per_second=10) as live:
+            for name, status in statuses:
+                results[name] = status
+                live.update(_check_table(results))
+    else:
+        results.update(statuses)
+        console.print(_check_table(results))
 
-    console.print(table)
+    all_found = all(found for found, _ in results.values())
 
     if all_found:
         rprint("\n[green]All tools found![/green]")
@@ -134,6 +357,8 @@ def init(
     ),
 ) -> None:
     """Initialise a new hatchkit project with AI agent configuration."""
+    from rich.panel import Panel
+
     # Resolve target directory
     if here or project_name in (None, "."):
         target = Path.cwd()
@@ -208,71 +433,93 @@ def _write_project_files(target: Path, ai: str | None, force: bool) -> None:
     hatchkit_dir = target / ".hatchkit"
     hatchkit_dir.mkdir(exist_ok=True)
 
-    _write_file(hatchkit_dir / "AGENTS.md", _AGENTS_MD_TEMPLATE, force=force)
-
+    writes: list[tuple[Path, str]] = [(hatchkit_dir / "AGENTS.md", _AGENTS_MD_TEMPLATE)]
+    summary = None
     if ai:
-        _write_ai_config(target, ai, force=force)
+        ai_writes, summary = _ai_config_files(target, ai)
+        writes.extend(ai_writes)
+
+    # The files are independent, so write them concurrently and report the
+    # results afterwards in a stable order. A lone file (no --ai) isn't worth
+    # starting a pool for.
+    cwd = Path.cwd()
+    if len(writes) == 1:
+        messages = [_write_file(*writes[0], force=force, cwd=cwd)]
+    else:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            messages = list(executor.map(lambda w: _write_file(*w, force=force, cwd=cwd), writes))
+    for message in messages:
+        rprint(message)
+    if summary:
+        rprint(summary)
 
     # Append to .gitignore if present
     gitignore = target / ".gitignore"
     if gitignore.exists():
-        content = gitignore.read_text()
-        if "# hatchkit" not in content:
-            gitignore.write_text(content + "\n" + _GITIGNORE_ADDITIONS)
-            rprint("  [dim]Updated .gitignore[/dim]")
+        # Read once and append in place rather than rewriting the whole file.
+        with gitignore.open("r+", encoding="utf-8") as f:
+            if "# hatchkit" not in f.read():
+                f.write("\n" + _GITIGNORE_ADDITIONS)
+                rprint("  [dim]Updated .gitignore[/dim]")
+
 
+def _ai_config_files(target: Path, ai: str) -> tuple[list[tuple[Path, str]], str]:
+    """Return the AI-agent-specific files to write and a summary line.
 
-def _write_ai_config(target: Path, ai: str, force: bool) -> None:
-    """Write AI-agent-specific command files."""
+    Parent directories are created here so the files can be written in any order.
+    """
     if ai == "claude":
         commands_dir = target / ".claude" / "commands"
         commands_dir.mkdir(parents=True, exist_ok=True)
-        for name, content in _load_command_templates().items():
-            _write_file(commands_dir / name, content, force=force)
-        rprint("  [dim]Wrote Claude Code commands → .claude/commands/[/dim]")
+        templates = _load_command_templates()
+        files = [(commands_dir / name, content) for name, content in templates.items()]
+        return files, "  [dim]Wrote Claude Code commands → .claude/commands/[/dim]"
 
-    elif ai == "copilot":
+    if ai == "copilot":
         instructions_dir = target / ".github"
         instructions_dir.mkdir(parents=True, exist_ok=True)
-        _write_file(
-            instructions_dir / "copilot-instructions.md",
-            _copilot_instructions_md(),
-            force=force,
-        )
-        rprint("  [dim]Wrote Copilot instructions → .github/copilot-instructions.md[/dim]")
+        files = [(instructions_dir / "copilot-instructions.md", _copilot_instructions_md())]
+        return files, "  [dim]Wrote Copilot instructions → .github/copilot-instructions.md[/dim]"
 
-    elif ai == "cursor":
+    if ai == "cursor":
         rules_dir = target / ".cursor" / "rules"
         rules_dir.mkdir(parents=True, exist_ok=True)
-        _write_file(rules_dir / "hatchkit.mdc", _agent_command_md("Cursor"), force=force)
-        rprint("  [dim]Wrote Cursor rules → .cursor/rules/hatchkit.mdc[/dim]")
+        files = [(rules_dir / "hatchkit.mdc", _agent_command_md("Cursor"))]
+        return files, "  [dim]Wrote Cursor rules → .cursor/rules/hatchkit.mdc[/dim]"
 
-    elif ai == "gemini":
+    if ai == "gemini":
         commands_dir = target / ".gemini"
         commands_dir.mkdir(parents=True, exist_ok=True)
-        _write_file(commands_dir / "GEMINI.md", _agent_command_md("Gemini CLI"), force=force)
-        rprint("  [dim]Wrote Gemini CLI config → .gemini/GEMINI.md[/dim]")
+        files = [(commands_dir / "GEMINI.md", _agent_command_md("Gemini CLI"))]
+        return files, "  [dim]Wrote Gemini CLI config → .gemini/GEMINI.md[/dim]"
 
-    elif ai in ("codex", "generic"):
-        commands_dir = target / ".ai" / "commands"
-        commands_dir.mkdir(parents=True, exist_ok=True)
-        _write_file(commands_dir / "hatchkit.md", _agent_command_md(ai.title()), force=force)
-        rprint(f"  [dim]Wrote {ai.title()} commands → .ai/commands/hatchkit.md[/dim]")
+    # codex / generic
+    commands_dir = target / ".ai" / "commands"
+    commands_dir.mkdir(parents=True, exist_ok=True)
+    files = [(commands_dir / "hatchkit.md", _agent_command_md(ai.title()))]
+    return files, f"  [dim]Wrote {ai.title()} commands → .ai/commands/hatchkit.md[/dim]"
 
 
-def _write_file(path: Path, content: str, force: bool) -> None:
-    """Write *content* to *path*, respecting the *force* flag."""
+def _write_file(path: Path, content: str, force: bool, cwd: Path) -> str:
+    """Write *content* to *path*, respecting the *force* flag.
+
+    Returns the status line to print, so callers can write files
+    concurrently and still report them in order. Written paths are shown
+    relative to *cwd* when they are inside it.
+    """
     if path.exists() and not force:
-        rprint(f"  [yellow]Skipped (already exists):[/yellow] {path.relative_to(path.parents[2])}")
-        return
+        return f"  [yellow]Skipped (already exists):[/yellow] {path.relative_to(path.parents[2])}"
     path.write_text(content)
-    try:
-        rel = path.relative_to(Path.cwd())
-    except ValueError:
-        rel = path
-    rprint(f"  [green]Wrote:[/green] {rel}")
+    # A prefix check avoids raising and catching ValueError from relative_to().
+    prefix = str(cwd)
+    if not prefix.endswith(os.sep):
+        prefix += os.sep
+    path_str = str(path)
+    rel = Path(path_str[len(prefix) :]) if path_str.startswith(prefix) else path
+    return f"  [green]Wrote:[/green] {rel}"
 
 
+@functools.cache
 def _agent_command_md(agent_name: str) -> str:
     return f"""\
 # hatchkit AI Development Guidelines
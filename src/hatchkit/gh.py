@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import functools
+import os
 import re
 import shutil
 import subprocess
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import typer
 from rich import print as rprint
 
+from hatchkit import _json
+
+if TYPE_CHECKING:
+    import httpx
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+# Remote URL formats accepted by get_repo_info.
+_SSH_RE = re.compile(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$")
+_HTTPS_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?$")
+
 
 class GhError(Exception):
     """Raised when a gh CLI command fails."""
@@ -22,21 +38,23 @@ def require_gh() -> None:
         raise typer.Exit(1)
 
 
+@functools.lru_cache(maxsize=1)
 def get_repo_info() -> tuple[str, str]:
     """Return (owner, repo) parsed from the git remote origin URL.
 
-    Supports both HTTPS and SSH remote formats.
+    Supports both HTTPS and SSH remote formats. The result is cached for the
+    lifetime of the process only; each ``hatchkit`` invocation looks it up again.
     """
     result = _run_command(["git", "remote", "get-url", "origin"])
     url = result.strip()
 
     # SSH: git@github.com:owner/repo.git
-    m = re.match(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$", url)
+    m = _SSH_RE.match(url)
     if m:
         return m.group(1), m.group(2)
 
     # HTTPS: https://github.com/owner/repo.git
-    m = re.match(r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?$", url)
+    m = _HTTPS_RE.match(url)
     if m:
         return m.group(1), m.group(2)
 
@@ -44,10 +62,15 @@ def get_repo_info() -> tuple[str, str]:
     raise typer.Exit(1)
 
 
-def get_pr_info() -> dict:
-    """Return PR info (number, url, headRefName) for the current branch."""
+@functools.lru_cache(maxsize=1)
+def get_pr_info() -> Mapping:
+    """Return PR info (number, url, headRefName) for the current branch.
+
+    The result is cached for the lifetime of the process and returned as a
+    read-only mapping, since every caller shares the same object.
+    """
     result = _run_gh(["pr", "view", "--json", "number,url,headRefName"])
-    return json.loads(result)
+    return MappingProxyType(_json.loads(result))
 
 
 def fetch_review_threads(
@@ -55,40 +78,34 @@ def fetch_review_threads(
 ) -> list[dict]:
     """Fetch review threads for a PR via GraphQL.
 
+    Only the first comment's body is requested for each thread, which is all
+    the ``--pretty`` table shows. Use :func:`fetch_review_threads_full` when
+    the comment history and authors are needed.
+
     By default returns only unresolved threads. Pass *all_threads=True*
     to include resolved threads as well.
     """
-    query = """
-    query($owner: String!, $repo: String!, $pr: Int!) {
-      repository(owner: $owner, name: $repo) {
-        pullRequest(number: $pr) {
-          reviewThreads(first: 100) {
-            nodes {
-              id
-              isResolved
-              path
-              line
-              comments(first: 10) {
-                nodes {
-                  author { login }
-                  body
-                  createdAt
-                }
-              }
-            }
-          }
-        }
-      }
-    }"""
-    variables = {"owner": owner, "repo": repo, "pr": pr}
-    data = _run_graphql(query, variables)
+    return _query_review_threads(
+        owner, repo, pr, comments=1, comment_fields="body", all_threads=all_threads
+    )
 
-    threads = data["data"]["repository"]["pullRequest"]["reviewThreads"]["nodes"]
 
-    if not all_threads:
-        threads = [t for t in threads if not t["isResolved"]]
+def fetch_review_threads_full(
+    owner: str, repo: str, pr: int, *, all_threads: bool = False
+) -> list[dict]:
+    """Fetch review threads for a PR with their recent comment history.
 
-    return threads
+    Like :func:`fetch_review_threads`, but each thread includes its first 10
+    comments with their author and creation time.
+    """
+    return _query_review_threads(
+        owner,
+        repo,
+        pr,
+        comments=10,
+        comment_fields="author { login } body createdAt",
+        all_threads=all_threads,
+    )
 
 
 def resolve_thread(thread_id: str) -> dict:
@@ -103,6 +120,30 @@ def resolve_thread(thread_id: str) -> dict:
     return _run_graphql(query, variables)
 
 
+def resolve_threads(thread_ids: list[str]) -> dict:
+    """Resolve several review threads with a single GraphQL request.
+
+    Each thread gets an aliased ``resolveReviewThread`` mutation (``r0``,
+    ``r1``, ...) in one document, so the response's ``data`` holds one entry
+    per thread in the order given.
+    """
+    if not thread_ids:
+        return {"data": {}}
+
+    params = ", ".join(f"$t{i}: ID!" for i in range(len(thread_ids)))
+    mutations = "\n".join(
+        f"      r{i}: resolveReviewThread(input: {{ threadId: $t{i} }}) {{"
+        " thread { id isResolved } }"
+        for i in range(len(thread_ids))
+    )
+    query = f"""
+    mutation({params}) {{
+{mutations}
+    }}"""
+    variables = {f"t{i}": thread_id for i, thread_id in enumerate(thread_ids)}
+    return _run_graphql(query, variables)
+
+
 def reply_to_thread(thread_id: str, body: str) -> dict:
     """Reply to a review thread via GraphQL mutation."""
     query = """
@@ -118,10 +159,33 @@ def reply_to_thread(thread_id: str, body: str) -> dict:
     return _run_graphql(query, variables)
 
 
+def reply_and_resolve_thread(thread_id: str, body: str) -> dict:
+    """Reply to and resolve a review thread in a single GraphQL request.
+
+    Both mutations are sent in one document so only one ``gh`` process is
+    spawned. The response contains both ``addPullRequestReviewThreadReply``
+    and ``resolveReviewThread`` under ``data``.
+    """
+    query = """
+    mutation($threadId: ID!, $body: String!) {
+      addPullRequestReviewThreadReply(input: {
+        pullRequestReviewThreadId: $threadId
+        body: $body
+      }) {
+        comment { id body }
+      }
+      resolveReviewThread(input: { threadId: $threadId }) {
+        thread { id isResolved }
+      }
+    }"""
+    variables = {"threadId": thread_id, "body": body}
+    return _run_graphql(query, variables)
+
+
 def get_pr_checks() -> list[dict]:
     """Return CI check statuses for the current PR."""
     result = _run_gh(["pr", "checks", "--json", "name,state,conclusion,link"])
-    return json.loads(result)
+    return _json.loads(result)
 
 
 # ---------------------------------------------------------------------------
@@ -129,48 +193,190 @@ def get_pr_checks() -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
+def _query_review_threads(
+    owner: str,
+    repo: str,
+    pr: int,
+    *,
+    comments: int,
+    comment_fields: str,
+    all_threads: bool,
+) -> list[dict]:
+    """Run the review threads query selecting *comments* x *comment_fields*.
+
+    Threads are fetched 100 at a time following the ``endCursor``; the next
+    page is requested in the background while the current one is processed.
+    """
+    query = f"""
+    query($owner: String!, $repo: String!, $pr: Int!, $after: String) {{
+      repository(owner: $owner, name: $repo) {{
+        pullRequest(number: $pr) {{
+          reviewThreads(first: 100, after: $after) {{
+            pageInfo {{ hasNextPage endCursor }}
+            nodes {{
+              id
+              isResolved
+              path
+              line
+              comments(first: {comments}) {{
+                nodes {{ {comment_fields} }}
+              }}
+            }}
+          }}
+        }}
+      }}
+    }}"""
+    variables = {"owner": owner, "repo": repo, "pr": pr}
+
+    threads: list[dict] = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        data = _run_graphql(query, variables)
+        while True:
+            review_threads = data["data"]["repository"]["pullRequest"]["reviewThreads"]
+            page_info = review_threads["pageInfo"]
+
+            next_page = None
+            if page_info["hasNextPage"]:
+                next_variables = {**variables, "after": page_info["endCursor"]}
+                next_page = executor.submit(_run_graphql, query, next_variables)
+
+            nodes = review_threads["nodes"]
+            if all_threads:
+                threads.extend(nodes)
+            else:
+                threads.extend(t for t in nodes if not t["isResolved"])
+
+            if next_page is None:
+                return threads
+            data = next_page.result()
+
+
 def _run_command(args: list[str]) -> str:
-    """Run a generic command and return stdout."""
+    """Run a generic command and return stdout decoded as UTF-8."""
+    return _run_command_bytes(args).decode("utf-8", errors="replace")
+
+
+def _run_command_bytes(args: list[str]) -> bytes:
+    """Run a generic command and return raw stdout.
+
+    Output is captured as bytes so JSON can be handed straight to the parser
+    and text is decoded as UTF-8 rather than the locale's encoding.
+    """
     try:
-        result = subprocess.run(args, capture_output=True, text=True, timeout=30)
+        result = subprocess.run(args, capture_output=True, timeout=30)
     except FileNotFoundError:
         rprint(f"[red]Error:[/red] Command not found: {args[0]}")
         raise typer.Exit(1)
 
     if result.returncode != 0:
-        stderr = result.stderr.strip()
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
         raise GhError(stderr or f"Command failed with exit code {result.returncode}")
 
     return result.stdout
 
 
-def _run_gh(args: list[str]) -> str:
-    """Run a ``gh`` subcommand and return stdout."""
+def _run_gh(args: list[str]) -> bytes:
+    """Run a ``gh`` subcommand and return raw stdout (typically JSON)."""
     require_gh()
-    return _run_command(["gh", *args])
+    return _run_command_bytes(["gh", *args])
 
 
 def _run_graphql(query: str, variables: dict) -> dict:
+    """Run a GraphQL query and return parsed JSON.
+
+    Queries are POSTed straight to the GitHub API over a pooled connection
+    when ``httpx`` is installed and a token is available, and go through
+    ``gh api graphql`` otherwise.
+    """
+    client = _graphql_client()
+    if client is not None:
+        data = _post_graphql(client, query, variables)
+    else:
+        data = _gh_graphql(query, variables)
+
+    errors = data.get("errors")
+    if errors:
+        msgs = "; ".join(e.get("message", str(e)) for e in errors)
+        rprint(f"[red]GraphQL error:[/red] {msgs}")
+        raise typer.Exit(1)
+
+    return data
+
+
+def _gh_graphql(query: str, variables: dict) -> dict:
     """Run a GraphQL query via ``gh api graphql`` and return parsed JSON.
 
     Uses ``-f`` for string variables and ``-F`` for integer variables.
     """
     require_gh()
 
-    cmd: list[str] = ["gh", "api", "graphql", "-f", f"query={query}"]
+    cmd = [
+        "gh",
+        "api",
+        "graphql",
+        "-f",
+        f"query={query}",
+        *(
+            arg
+            for key, value in variables.items()
+            for arg in ("-F" if isinstance(value, int) else "-f", f"{key}={value}")
+        ),
+    ]
+    return _json.loads(_run_command_bytes(cmd))
+
+
+def _post_graphql(client: httpx.Client, query: str, variables: dict) -> dict:
+    """POST a GraphQL query with *client* and return parsed JSON."""
+    import httpx
 
-    for key, value in variables.items():
-        if isinstance(value, int):
-            cmd.extend(["-F", f"{key}={value}"])
-        else:
-            cmd.extend(["-f", f"{key}={value}"])
+    try:
+        response = client.post(GRAPHQL_URL, json={"query": query, "variables": variables})
+    except httpx.HTTPError as exc:
+        raise GhError(f"GraphQL request failed: {exc}") from exc
 
-    result = _run_command(cmd)
-    data = json.loads(result)
+    if response.status_code != 200:
+        raise GhError(
+            f"GraphQL request failed with HTTP {response.status_code}: {response.text.strip()}"
+        )
 
-    if "errors" in data:
-        msgs = [e.get("message", str(e)) for e in data["errors"]]
-        rprint(f"[red]GraphQL error:[/red] {'; '.join(msgs)}")
-        raise typer.Exit(1)
+    return _json.loads(response.content)
 
-    return data
+
+@functools.lru_cache(maxsize=1)
+def _gh_token() -> str | None:
+    """Return a GitHub token from ``$GH_TOKEN``/``$GITHUB_TOKEN`` or ``gh auth token``."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    if shutil.which("gh") is None:
+        return None
+    try:
+        return _run_command(["gh", "auth", "token"]).strip() or None
+    except GhError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _graphql_client() -> httpx.Client | None:
+    """Return a shared HTTP client for the GraphQL API, or None to use ``gh``.
+
+    The client is created on first use and reused for the rest of the
+    process, so every query after the first skips the TCP/TLS handshake.
+    ``httpx`` is imported here rather than at module load since it is slow
+    to import and most commands never need it.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+    token = _gh_token()
+    if token is None:
+        return None
+    headers = {"Authorization": f"bearer {token}", "Accept": "application/vnd.github+json"}
+    try:
+        client = httpx.Client(http2=True, headers=headers, timeout=30)
+    except ImportError:
+        # http2=True needs the optional ``h2`` package.
+        client = httpx.Client(headers=headers, timeout=30)
+    atexit.register(client.close)
+    return client
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import sys
+from typing import TYPE_CHECKING
 
 import typer
 from rich import print as rprint
-from rich.console import Console
-from rich.table import Table
 
-from hatchkit import gh
+from hatchkit import _json, gh
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 pr_app = typer.Typer(
     name="pr",
@@ -17,12 +20,28 @@ pr_app = typer.Typer(
     no_args_is_help=True,
 )
 
-console = Console()
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """Return the shared Rich console, importing Rich's console lazily."""
+    from rich.console import Console
+
+    return Console()
 
 
 def _json_out(data: object) -> None:
-    """Print data as compact JSON to stdout."""
-    print(json.dumps(data, indent=2))
+    """Print data as indented JSON to stdout.
+
+    The encoded bytes go straight to the underlying binary buffer when there
+    is one, skipping a decode/re-encode through the text layer.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(_json.dumps(data))
+        return
+    sys.stdout.flush()
+    buffer.write(_json.dumpb(data) + b"\n")
+    buffer.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -42,7 +61,7 @@ def info(
         rprint(f"  URL : [link={data['url']}]{data['url']}[/link]")
         rprint(f"  Branch: {data['headRefName']}")
     else:
-        _json_out(data)
+        _json_out(dict(data))
 
 
 @pr_app.command()
@@ -65,13 +84,15 @@ def threads(
         pr_info = gh.get_pr_info()
         pr = pr_info["number"]
 
-    thread_list = gh.fetch_review_threads(owner, repo, pr, all_threads=all_threads)
-
     if pretty:
+        thread_list = gh.fetch_review_threads(owner, repo, pr, all_threads=all_threads)
+
         if not thread_list:
             rprint("[green]No unresolved threads.[/green]")
             return
 
+        from rich.table import Table
+
         table = Table(title="Review Threads", show_header=True, header_style="bold magenta")
         table.add_column("#", style="dim", no_wrap=True)
         table.add_column("File", style="cyan")
@@ -92,12 +113,12 @@ def threads(
                 first_comment,
             )
 
-        console.print(table)
+        _console().print(table)
         rprint("\n  [dim]Thread IDs (for resolve/reply):[/dim]")
         for i, t in enumerate(thread_list, 1):
             rprint(f"    {i}. {t['id']}")
     else:
-        _json_out(thread_list)
+        _json_out(gh.fetch_review_threads_full(owner, repo, pr, all_threads=all_threads))
 
 
 @pr_app.command()
@@ -114,6 +135,48 @@ def resolve(
         _json_out(result)
 
 
+@pr_app.command("resolve-all")
+def resolve_all(
+    thread_ids: list[str] | None = typer.Argument(
+        None, help="Node IDs of the review threads to resolve."
+    ),
+    all_unresolved: bool = typer.Option(
+        False, "--all-unresolved", help="Resolve every unresolved thread on the PR."
+    ),
+    owner: str | None = typer.Option(None, "--owner", help="Repository owner (auto-detected)."),
+    repo: str | None = typer.Option(None, "--repo", help="Repository name (auto-detected)."),
+    pr: int | None = typer.Option(None, "--pr", help="PR number (auto-detected)."),
+    pretty: bool = typer.Option(False, "--pretty", help="Rich-formatted output for humans."),
+) -> None:
+    """Resolve several review threads in a single request."""
+    ids = list(thread_ids or [])
+
+    if all_unresolved:
+        if owner is None or repo is None:
+            detected_owner, detected_repo = gh.get_repo_info()
+            owner = owner or detected_owner
+            repo = repo or detected_repo
+
+        if pr is None:
+            pr = gh.get_pr_info()["number"]
+
+        ids.extend(t["id"] for t in gh.fetch_review_threads(owner, repo, pr))
+    elif not ids:
+        rprint("[red]Error:[/red] Pass one or more thread IDs or --all-unresolved.")
+        raise typer.Exit(1)
+
+    ids = list(dict.fromkeys(ids))
+    result = gh.resolve_threads(ids)
+
+    if pretty:
+        if not ids:
+            rprint("[green]No unresolved threads.[/green]")
+        for thread_id in ids:
+            rprint(f"[green]Resolved thread[/green] {thread_id}")
+    else:
+        _json_out(result)
+
+
 @pr_app.command()
 def reply(
     thread_id: str = typer.Argument(help="The node ID of the review thread to reply to."),
@@ -124,11 +187,17 @@ def reply(
     pretty: bool = typer.Option(False, "--pretty", help="Rich-formatted output for humans."),
 ) -> None:
     """Reply to a review thread, optionally resolving it."""
-    reply_result = gh.reply_to_thread(thread_id, body)
-
     resolve_result = None
     if resolve_thread:
-        resolve_result = gh.resolve_thread(thread_id)
+        # Both mutations go out in one request; split the response so the
+        # JSON output keeps the same shape as separate reply/resolve calls.
+        data = gh.reply_and_resolve_thread(thread_id, body)["data"]
+        reply_result = {
+            "data": {"addPullRequestReviewThreadReply": data["addPullRequestReviewThreadReply"]}
+        }
+        resolve_result = {"data": {"resolveReviewThread": data["resolveReviewThread"]}}
+    else:
+        reply_result = gh.reply_to_thread(thread_id, body)
 
     if pretty:
         rprint(f"[green]Replied to thread[/green] {thread_id}")
@@ -153,6 +222,8 @@ def checks(
             rprint("[dim]No checks found.[/dim]")
             return
 
+        from rich.table import Table
+
         table = Table(title="PR Checks", show_header=True, header_style="bold magenta")
         table.add_column("Name", style="cyan")
         table.add_column("State")
@@ -173,6 +244,6 @@ def checks(
                 c.get("link", "") or "–",
             )
 
-        console.print(table)
+        _console().print(table)
     else:
         _json_out(check_list)
@@ -2,14 +2,36 @@
 
 from __future__ import annotations
 
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from rich.console import Console
 from typer.testing import CliRunner
 
 from hatchkit import __version__
-from hatchkit.cli import app
+from hatchkit.cli import (
+    TOOL_CACHE_TTL,
+    TOOLS_TO_CHECK,
+    _iter_probe_tools,
+    _iter_tool_statuses,
+    _load_tool_cache,
+    _write_file,
+    app,
+)
 
 runner = CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def _isolated_tool_cache(tmp_path, monkeypatch):
+    """Keep the check tool cache out of the real user cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 # ---------------------------------------------------------------------------
 # version
 # ---------------------------------------------------------------------------
@@ -34,16 +56,141 @@ def test_check_command_runs():
     assert "Tool Check" in result.output or "tool" in result.output.lower()
 
 
+def test_check_keeps_tool_order(monkeypatch):
+    """Rows should follow TOOLS_TO_CHECK order even though probes finish out of order."""
+
+    def fake_probe(names):
+        for name in reversed(names):
+            yield name, (True, f"{name} 1.0")
+
+    monkeypatch.setattr("shutil.which", lambda name: sys.executable)
+    monkeypatch.setattr("hatchkit.cli._iter_probe_tools", fake_probe)
+    result = runner.invoke(app, ["check"])
+    assert result.exit_code == 0
+    positions = [result.output.index(f"{tool} 1.0") for tool in TOOLS_TO_CHECK]
+    assert positions == sorted(positions)
+    assert "checking" not in result.output
+    assert "All tools found!" in result.output
+
+
+def test_check_live_table_on_terminal(monkeypatch):
+    buffer = io.StringIO()
+    console = Console(file=buffer, force_terminal=True, width=120)
+
+    def fake_probe(names):
+        for name in names:
+            yield name, (True, f"{name} 1.0")
+
+    monkeypatch.setattr("hatchkit.cli._console", lambda: console)
+    monkeypatch.setattr("shutil.which", lambda name: sys.executable)
+    monkeypatch.setattr("hatchkit.cli._iter_probe_tools", fake_probe)
+    result = runner.invoke(app, ["check"])
+    assert result.exit_code == 0
+    assert "codex 1.0" in buffer.getvalue()
+
+
+def _fake_tool(directory, name: str, output: str) -> None:
+    script = directory / name
+    script.write_text(f"#!/bin/sh\nprintf '{output}'\n")
+    script.chmod(0o755)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell probe is POSIX-only")
+def test_iter_probe_tools_shell_probe(tmp_path, monkeypatch):
+    _fake_tool(tmp_path, "a", "a 2.3\\nextra line\\n")
+    _fake_tool(tmp_path, "c", "")
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}/usr/bin{os.pathsep}/bin")
+    assert dict(_iter_probe_tools(["a", "b", "c"])) == {
+        "a": (True, "a 2.3"),
+        "b": (False, ""),
+        "c": (True, str(tmp_path / "c")),
+    }
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell probe is POSIX-only")
+def test_iter_probe_tools_does_not_reprobe_hung_tool(tmp_path, monkeypatch):
+    hang = tmp_path / "hang"
+    hang.write_text("#!/bin/sh\nsleep 30\n")
+    hang.chmod(0o755)
+    _fake_tool(tmp_path, "a", "a 2.3\\n")
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}/usr/bin{os.pathsep}/bin")
+    monkeypatch.setattr("hatchkit.cli._PROBE_TIMEOUT", 0.5)
+    monkeypatch.setattr("hatchkit.cli._tool_status", lambda name: pytest.fail("re-probed"))
+    start = time.monotonic()
+    assert dict(_iter_probe_tools(["hang", "a"])) == {
+        "hang": (True, str(hang)),
+        "a": (True, "a 2.3"),
+    }
+    assert time.monotonic() - start < 5
+
+
+def test_iter_probe_tools_falls_back_on_windows(monkeypatch):
+    monkeypatch.setattr("hatchkit.cli.os.name", "nt")
+    monkeypatch.setattr("hatchkit.cli._tool_status", lambda name: (True, f"{name} 1.0"))
+    assert dict(_iter_probe_tools(["a", "b"])) == {"a": (True, "a 1.0"), "b": (True, "b 1.0")}
+
+
+def test_iter_tool_statuses_uses_cache_until_refresh(monkeypatch):
+    probed: list[list[str]] = []
+
+    def fake_probe(names):
+        probed.append(names)
+        return [(name, (True, f"{name} 1.0")) for name in names]
+
+    monkeypatch.setattr("shutil.which", lambda name: sys.executable if name == "a" else None)
+    monkeypatch.setattr("hatchkit.cli._iter_probe_tools", fake_probe)
+
+    expected = {"a": (True, "a 1.0"), "b": (False, "")}
+    assert dict(_iter_tool_statuses(["a", "b"])) == expected
+    assert dict(_iter_tool_statuses(["a", "b"])) == expected
+    assert probed == [["a"]]
+
+    dict(_iter_tool_statuses(["a", "b"], refresh=True))
+    assert probed == [["a"], ["a"]]
+
+
+def test_iter_tool_statuses_ignores_expired_cache(monkeypatch):
+    probed: list[list[str]] = []
+
+    def fake_probe(names):
+        probed.append(names)
+        return [("a", (True, "a 1.0"))]
+
+    monkeypatch.setattr("shutil.which", lambda name: sys.executable)
+    monkeypatch.setattr("hatchkit.cli._iter_probe_tools", fake_probe)
+    dict(_iter_tool_statuses(["a"]))
+
+    now = time.time()
+    monkeypatch.setattr("time.time", lambda: now + TOOL_CACHE_TTL + 1)
+    dict(_iter_tool_statuses(["a"]))
+    assert probed == [["a"], ["a"]]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell probe is POSIX-only")
+def test_iter_tool_statuses_does_not_cache_timed_out_probe(tmp_path, monkeypatch):
+    hang = tmp_path / "hang"
+    hang.write_text("#!/bin/sh\nsleep 30\n")
+    hang.chmod(0o755)
+    _fake_tool(tmp_path, "a", "a 2.3\\n")
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}/usr/bin{os.pathsep}/bin")
+    monkeypatch.setattr("hatchkit.cli._PROBE_TIMEOUT", 0.5)
+    assert dict(_iter_tool_statuses(["hang", "a"]))["hang"] == (True, str(hang))
+    cache = _load_tool_cache()
+    assert "hang" not in cache
+    assert cache["a"]["version"] == "a 2.3"
+
+
 # ---------------------------------------------------------------------------
 # init – basic usage
 # ---------------------------------------------------------------------------
 
 
-def test_init_creates_directory(tmp_path):
+def test_init_creates_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
     result = runner.invoke(app, ["init", "my-project"], catch_exceptions=False)
-    # The runner uses CWD, so we check stdout for the project name
     assert result.exit_code == 0
     assert "my-project" in result.output
+    assert (tmp_path / "my-project" / ".hatchkit" / "AGENTS.md").exists()
 
 
 def test_init_here_creates_hatchkit_dir(tmp_path, monkeypatch):
@@ -68,6 +215,38 @@ def test_init_with_claude_ai(tmp_path, monkeypatch):
     assert (tmp_path / ".claude" / "commands" / "hatchkit.prfix.md").exists()
 
 
+def test_init_reports_each_file_before_summary(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["init", "--here", "--ai", "claude"], catch_exceptions=False)
+    lines = result.output.splitlines()
+    agents = lines.index("  Wrote: .hatchkit/AGENTS.md")
+    summary = lines.index("  Wrote Claude Code commands → .claude/commands/")
+    assert agents < summary
+    assert "  Wrote: .claude/commands/hatchkit.prfix.md" in lines[agents:summary]
+
+
+def test_init_single_file_skips_thread_pool(tmp_path, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool should not be used for a single file")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("hatchkit.cli.ThreadPoolExecutor", no_pool)
+    result = runner.invoke(app, ["init", "--here"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert (tmp_path / ".hatchkit" / "AGENTS.md").exists()
+
+
+def test_write_file_reports_path_relative_to_cwd(tmp_path):
+    inside = tmp_path / "a" / "b" / "c.md"
+    inside.parent.mkdir(parents=True)
+    message = _write_file(inside, "x", force=False, cwd=tmp_path)
+    assert message.endswith(f" {Path('a', 'b', 'c.md')}")
+
+    outside = tmp_path / "out.md"
+    message = _write_file(outside, "x", force=False, cwd=tmp_path / "a")
+    assert message.endswith(str(outside))
+
+
 def test_init_claude_creates_prfix_command(tmp_path, monkeypatch):
     """The prfix template should contain frontmatter and hatchkit pr commands."""
     monkeypatch.chdir(tmp_path)
@@ -144,7 +323,7 @@ def test_init_updates_gitignore(tmp_path, monkeypatch):
 
     runner.invoke(app, ["init", "--here"], catch_exceptions=False)
     content = gitignore.read_text()
-    assert "# hatchkit" in content
+    assert content == "*.pyc\n\n# hatchkit\n.hatchkit/cache/\n"
 
 
 def test_init_does_not_duplicate_gitignore_entry(tmp_path, monkeypatch):
@@ -1,84 +1,184 @@
 """Unit tests for hatchkit.gh — GitHub CLI wrappers."""
 
-from __future__ import annotations
-
-import json
+import functools
+import shutil
 import subprocess
-from unittest.mock import patch
+import sys
+from types import SimpleNamespace
 
 import pytest
 import typer
 
-from hatchkit import gh
+from hatchkit import _json, gh
 
-# ---------------------------------------------------------------------------
-# require_gh
-# ---------------------------------------------------------------------------
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
+requires_httpx = pytest.mark.skipif(httpx is None, reason="httpx not installed")
+
+
+_THREAD_COMMENTS = {"nodes": [{"author": {"login": "rev"}, "body": "fix", "createdAt": "now"}]}
+
+
+def _make_thread(thread_id: str, *, resolved: bool = False, path: str = "f.py") -> dict:
+    # Threads share one comments subtree; nothing under test mutates it.
+    return {
+        "id": thread_id,
+        "isResolved": resolved,
+        "path": path,
+        "line": 10,
+        "comments": _THREAD_COMMENTS,
+    }
+
+
+def _threads_page(threads: list[dict], end_cursor: str | None = None) -> dict:
+    page_info = {"hasNextPage": end_cursor is not None, "endCursor": end_cursor}
+    review_threads = {"pageInfo": page_info, "nodes": threads}
+    return {"data": {"repository": {"pullRequest": {"reviewThreads": review_threads}}}}
+
+
+_PR_INFO = {"number": 42, "url": "https://github.com/a/b/pull/42", "headRefName": "feat/x"}
+_THREADS = [_make_thread("t1", resolved=False), _make_thread("t2", resolved=True)]
+
+_RESOLVE_RESP = {"data": {"resolveReviewThread": {"thread": {"id": "t1", "isResolved": True}}}}
+_RESOLVE_BATCH_RESP = {
+    "data": {
+        "r0": {"thread": {"id": "t1", "isResolved": True}},
+        "r1": {"thread": {"id": "t2", "isResolved": True}},
+    }
+}
+_REPLY_RESP = {
+    "data": {"addPullRequestReviewThreadReply": {"comment": {"id": "c1", "body": "done"}}}
+}
+_REPLY_AND_RESOLVE_RESP = {"data": {**_REPLY_RESP["data"], **_RESOLVE_RESP["data"]}}
+_CHECKS = [{"name": "ci", "state": "completed", "conclusion": "success", "link": ""}]
+_ERRORS_RESP = {"errors": [{"message": "Something went wrong"}]}
+
+_PR_INFO_JSON = _json.dumpb(_PR_INFO)
+_THREADS_JSON = _json.dumpb(_threads_page(_THREADS))
+_NO_THREADS_JSON = _json.dumpb(_threads_page([]))
+_RESOLVE_RESP_JSON = _json.dumpb(_RESOLVE_RESP)
+_RESOLVE_BATCH_RESP_JSON = _json.dumpb(_RESOLVE_BATCH_RESP)
+_REPLY_RESP_JSON = _json.dumpb(_REPLY_RESP)
+_REPLY_AND_RESOLVE_RESP_JSON = _json.dumpb(_REPLY_AND_RESOLVE_RESP)
+_CHECKS_JSON = _json.dumpb(_CHECKS)
+_ERRORS_RESP_JSON = _json.dumpb(_ERRORS_RESP)
+
+
+class _FakeProc:
+    """Slot-only stand-in for the ``subprocess.CompletedProcess`` gh reads."""
+
+    __slots__ = ("args", "returncode", "stdout", "stderr")
+
+    def __init__(self, *, stdout: bytes = b"", returncode: int = 0, stderr: bytes = b"") -> None:
+        self.args: list[str] = []
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+@functools.cache
+def _fake(*, stdout: bytes = b"", returncode: int = 0, stderr: bytes = b"") -> _FakeProc:
+    """Return the shared _FakeProc for this result; equal results are one object."""
+    return _FakeProc(stdout=stdout, returncode=returncode, stderr=stderr)
+
+
+_OK_EMPTY = _fake(stdout=b"{}")
+_GH_AUTH_TOKEN = _fake(stdout=b"gho_abc\n")
+
+
+@pytest.fixture(scope="session")
+def gh_out():
+    """Canned successful ``gh`` results, serialised once for the whole session."""
+    return SimpleNamespace(
+        pr_info=_fake(stdout=_PR_INFO_JSON),
+        threads=_fake(stdout=_THREADS_JSON),
+        no_threads=_fake(stdout=_NO_THREADS_JSON),
+        resolve=_fake(stdout=_RESOLVE_RESP_JSON),
+        resolve_batch=_fake(stdout=_RESOLVE_BATCH_RESP_JSON),
+        reply=_fake(stdout=_REPLY_RESP_JSON),
+        reply_and_resolve=_fake(stdout=_REPLY_AND_RESOLVE_RESP_JSON),
+        checks=_fake(stdout=_CHECKS_JSON),
+        graphql_errors=_fake(stdout=_ERRORS_RESP_JSON),
+    )
+
+
+def _stub_gh(monkeypatch, *results: _FakeProc) -> list[list[str]]:
+    """Have ``subprocess.run`` return *results* in turn, repeating the last.
+
+    Returns the list that each command's argv is appended to.
+    """
+    calls: list[list[str]] = []
+
+    def run(args, **kwargs):
+        calls.append(args)
+        return results[min(len(calls), len(results)) - 1]
+
+    monkeypatch.setattr(subprocess, "run", run)
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def _gh_present(monkeypatch):
+    """Report ``gh`` as installed; tests that need it missing override this."""
+    monkeypatch.setattr(shutil, "which", lambda name: "/usr/bin/gh" if name == "gh" else None)
 
-def test_require_gh_found():
-    with patch("shutil.which", return_value="/usr/bin/gh"):
-        gh.require_gh()  # should not raise
 
+@pytest.fixture(autouse=True)
+def _clear_gh_caches(monkeypatch):
+    """Each test mocks different command output, so drop memoized lookups.
 
-def test_require_gh_missing():
-    with patch("shutil.which", return_value=None):
-        with pytest.raises(typer.Exit):
-            gh.require_gh()
+    httpx is hidden so GraphQL goes through the (mocked) ``gh`` subprocess
+    unless a test opts back in.
+    """
+    monkeypatch.setitem(sys.modules, "httpx", None)
+    gh.get_repo_info.cache_clear()
+    gh.get_pr_info.cache_clear()
+    gh._gh_token.cache_clear()
+    gh._graphql_client.cache_clear()
 
 
 # ---------------------------------------------------------------------------
-# get_repo_info
+# require_gh
 # ---------------------------------------------------------------------------
 
 
-def test_get_repo_info_https():
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout="https://github.com/alice/my-repo.git\n", stderr=""
-    )
-    with patch("subprocess.run", return_value=fake):
-        owner, repo = gh.get_repo_info()
-    assert owner == "alice"
-    assert repo == "my-repo"
+def test_require_gh_found():
+    gh.require_gh()  # should not raise
 
 
-def test_get_repo_info_https_no_dotgit():
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout="https://github.com/alice/my-repo\n", stderr=""
-    )
-    with patch("subprocess.run", return_value=fake):
-        owner, repo = gh.get_repo_info()
-    assert owner == "alice"
-    assert repo == "my-repo"
+def test_require_gh_missing(monkeypatch):
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    with pytest.raises(typer.Exit):
+        gh.require_gh()
 
 
-def test_get_repo_info_ssh():
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout="git@github.com:bob/cool-project.git\n", stderr=""
-    )
-    with patch("subprocess.run", return_value=fake):
-        owner, repo = gh.get_repo_info()
-    assert owner == "bob"
-    assert repo == "cool-project"
+# ---------------------------------------------------------------------------
+# get_repo_info
+# ---------------------------------------------------------------------------
 
 
-def test_get_repo_info_ssh_no_dotgit():
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout="git@github.com:bob/cool-project\n", stderr=""
-    )
-    with patch("subprocess.run", return_value=fake):
-        owner, repo = gh.get_repo_info()
-    assert owner == "bob"
-    assert repo == "cool-project"
+@pytest.mark.parametrize(
+    ("url", "owner", "repo"),
+    [
+        (b"https://github.com/alice/my-repo.git\n", "alice", "my-repo"),
+        (b"https://github.com/alice/my-repo\n", "alice", "my-repo"),
+        (b"git@github.com:bob/cool-project.git\n", "bob", "cool-project"),
+        (b"git@github.com:bob/cool-project\n", "bob", "cool-project"),
+    ],
+    ids=["https", "https-no-dotgit", "ssh", "ssh-no-dotgit"],
+)
+def test_get_repo_info(monkeypatch, url, owner, repo):
+    _stub_gh(monkeypatch, _fake(stdout=url))
+    assert gh.get_repo_info() == (owner, repo)
 
 
-def test_get_repo_info_unparseable():
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout="https://gitlab.com/x/y.git\n", stderr=""
-    )
-    with patch("subprocess.run", return_value=fake):
-        with pytest.raises(typer.Exit):
-            gh.get_repo_info()
+def test_get_repo_info_unparseable(monkeypatch):
+    _stub_gh(monkeypatch, _fake(stdout=b"https://gitlab.com/x/y.git\n"))
+    with pytest.raises(typer.Exit):
+        gh.get_repo_info()
 
 
 # ---------------------------------------------------------------------------
@@ -86,16 +186,21 @@ def test_get_repo_info_unparseable():
 # ---------------------------------------------------------------------------
 
 
-def test_get_pr_info():
-    payload = {"number": 42, "url": "https://github.com/a/b/pull/42", "headRefName": "feat/x"}
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=json.dumps(payload), stderr=""
-    )
-    with patch("shutil.which", return_value="/usr/bin/gh"):
-        with patch("subprocess.run", return_value=fake):
-            result = gh.get_pr_info()
+def test_get_pr_info(monkeypatch, gh_out):
+    _stub_gh(monkeypatch, gh_out.pr_info)
+    result = gh.get_pr_info()
     assert result["number"] == 42
     assert result["headRefName"] == "feat/x"
+    with pytest.raises(TypeError):
+        result["number"] = 1
+
+
+def test_get_pr_info_is_memoized(monkeypatch, gh_out):
+    calls = _stub_gh(monkeypatch, gh_out.pr_info)
+    first = gh.get_pr_info()
+    second = gh.get_pr_info()
+    assert first is second
+    assert len(calls) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -103,85 +208,99 @@ def test_get_pr_info():
 # ---------------------------------------------------------------------------
 
 
-def _make_thread(thread_id: str, *, resolved: bool = False, path: str = "f.py") -> dict:
-    return {
-        "id": thread_id,
-        "isResolved": resolved,
-        "path": path,
-        "line": 10,
-        "comments": {"nodes": [{"author": {"login": "rev"}, "body": "fix", "createdAt": "now"}]},
-    }
-
-
-def test_fetch_review_threads_filters_resolved():
-    threads = [_make_thread("t1", resolved=False), _make_thread("t2", resolved=True)]
-    graphql_response = {
-        "data": {
-            "repository": {"pullRequest": {"reviewThreads": {"nodes": threads}}}
-        }
-    }
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=json.dumps(graphql_response), stderr=""
-    )
-    with patch("shutil.which", return_value="/usr/bin/gh"):
-        with patch("subprocess.run", return_value=fake):
-            result = gh.fetch_review_threads("owner", "repo", 1)
+def test_fetch_review_threads_filters_resolved(monkeypatch, gh_out):
+    _stub_gh(monkeypatch, gh_out.threads)
+    result = gh.fetch_review_threads("owner", "repo", 1)
     assert len(result) == 1
     assert result[0]["id"] == "t1"
 
 
-def test_fetch_review_threads_all():
-    threads = [_make_thread("t1", resolved=False), _make_thread("t2", resolved=True)]
-    graphql_response = {
-        "data": {
-            "repository": {"pullRequest": {"reviewThreads": {"nodes": threads}}}
-        }
-    }
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=json.dumps(graphql_response), stderr=""
-    )
-    with patch("shutil.which", return_value="/usr/bin/gh"):
-        with patch("subprocess.run", return_value=fake):
-            result = gh.fetch_review_threads("owner", "repo", 1, all_threads=True)
+def test_fetch_review_threads_all(monkeypatch, gh_out):
+    _stub_gh(monkeypatch, gh_out.threads)
+    result = gh.fetch_review_threads("owner", "repo", 1, all_threads=True)
     assert len(result) == 2
 
 
+def test_fetch_review_threads_follows_pages(monkeypatch):
+    pages = [
+        _threads_page([_make_thread("t1"), _make_thread("t2", resolved=True)], "c1"),
+        _threads_page([_make_thread("t3")]),
+    ]
+    fakes = [_fake(stdout=_json.dumpb(p)) for p in pages]
+    calls = _stub_gh(monkeypatch, *fakes)
+    result = gh.fetch_review_threads("owner", "repo", 1)
+    assert [t["id"] for t in result] == ["t1", "t3"]
+    assert len(calls) == 2
+    assert "after=c1" in calls[-1]
+
+
+def test_fetch_review_threads_requests_first_comment_body_only(monkeypatch, gh_out):
+    calls = _stub_gh(monkeypatch, gh_out.no_threads)
+    gh.fetch_review_threads("owner", "repo", 1)
+    query = calls[-1][4]
+    assert "comments(first: 1)" in query
+    assert "author" not in query
+
+
+def test_fetch_review_threads_full_includes_history(monkeypatch, gh_out):
+    calls = _stub_gh(monkeypatch, gh_out.threads)
+    result = gh.fetch_review_threads_full("owner", "repo", 1)
+    query = calls[-1][4]
+    assert "comments(first: 10)" in query
+    assert "author { login }" in query
+    assert "createdAt" in query
+    assert [t["id"] for t in result] == ["t1"]
+
+
 # ---------------------------------------------------------------------------
 # resolve_thread
 # ---------------------------------------------------------------------------
 
 
-def test_resolve_thread():
-    graphql_response = {
-        "data": {"resolveReviewThread": {"thread": {"id": "t1", "isResolved": True}}}
-    }
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=json.dumps(graphql_response), stderr=""
-    )
-    with patch("shutil.which", return_value="/usr/bin/gh"):
-        with patch("subprocess.run", return_value=fake):
-            result = gh.resolve_thread("t1")
+def test_resolve_thread(monkeypatch, gh_out):
+    _stub_gh(monkeypatch, gh_out.resolve)
+    result = gh.resolve_thread("t1")
     assert result["data"]["resolveReviewThread"]["thread"]["isResolved"] is True
 
 
+def test_resolve_threads_batches_mutations(monkeypatch, gh_out):
+    calls = _stub_gh(monkeypatch, gh_out.resolve_batch)
+    result = gh.resolve_threads(["t1", "t2"])
+    assert len(calls) == 1
+    cmd = calls[-1]
+    assert "r1: resolveReviewThread(input: { threadId: $t1 })" in cmd[4]
+    assert "t0=t1" in cmd and "t1=t2" in cmd
+    assert result["data"]["r1"]["thread"]["id"] == "t2"
+
+
+def test_resolve_threads_empty_skips_request(monkeypatch):
+    calls = _stub_gh(monkeypatch, _OK_EMPTY)
+    assert gh.resolve_threads([]) == {"data": {}}
+    assert calls == []
+
+
 # ---------------------------------------------------------------------------
 # reply_to_thread
 # ---------------------------------------------------------------------------
 
 
-def test_reply_to_thread():
-    graphql_response = {
-        "data": {
-            "addPullRequestReviewThreadReply": {"comment": {"id": "c1", "body": "done"}}
-        }
-    }
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=json.dumps(graphql_response), stderr=""
-    )
-    with patch("shutil.which", return_value="/usr/bin/gh"):
-        with patch("subprocess.run", return_value=fake):
-            result = gh.reply_to_thread("t1", "done")
+def test_reply_to_thread(monkeypatch, gh_out):
+    _stub_gh(monkeypatch, gh_out.reply)
+    result = gh.reply_to_thread("t1", "done")
+    assert result["data"]["addPullRequestReviewThreadReply"]["comment"]["body"] == "done"
+
+
+# ---------------------------------------------------------------------------
+# reply_and_resolve_thread
+# ---------------------------------------------------------------------------
+
+
+def test_reply_and_resolve_thread_single_call(monkeypatch, gh_out):
+    calls = _stub_gh(monkeypatch, gh_out.reply_and_resolve)
+    result = gh.reply_and_resolve_thread("t1", "done")
+    assert len(calls) == 1
     assert result["data"]["addPullRequestReviewThreadReply"]["comment"]["body"] == "done"
+    assert result["data"]["resolveReviewThread"]["thread"]["isResolved"] is True
 
 
 # ---------------------------------------------------------------------------
@@ -189,14 +308,9 @@ def test_reply_to_thread():
 # ---------------------------------------------------------------------------
 
 
-def test_get_pr_checks():
-    checks = [{"name": "ci", "state": "completed", "conclusion": "success", "link": ""}]
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=json.dumps(checks), stderr=""
-    )
-    with patch("shutil.which", return_value="/usr/bin/gh"):
-        with patch("subprocess.run", return_value=fake):
-            result = gh.get_pr_checks()
+def test_get_pr_checks(monkeypatch, gh_out):
+    _stub_gh(monkeypatch, gh_out.checks)
+    result = gh.get_pr_checks()
     assert result[0]["name"] == "ci"
 
 
@@ -205,15 +319,124 @@ def test_get_pr_checks():
 # ---------------------------------------------------------------------------
 
 
-def test_run_graphql_raises_on_errors():
-    response = {"errors": [{"message": "Something went wrong"}]}
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=json.dumps(response), stderr=""
-    )
-    with patch("shutil.which", return_value="/usr/bin/gh"):
-        with patch("subprocess.run", return_value=fake):
-            with pytest.raises(typer.Exit):
-                gh._run_graphql("query { viewer { login } }", {})
+def test_run_graphql_raises_on_errors(monkeypatch, gh_out):
+    _stub_gh(monkeypatch, gh_out.graphql_errors)
+    with pytest.raises(typer.Exit):
+        gh._run_graphql("query { viewer { login } }", {})
+
+
+def test_gh_graphql_typed_variable_flags(monkeypatch):
+    calls = _stub_gh(monkeypatch, _OK_EMPTY)
+    gh._gh_graphql("query", {"owner": "o", "pr": 5})
+    assert calls[-1] == ["gh", "api", "graphql", "-f", "query=query", "-f", "owner=o", "-F", "pr=5"]
+
+
+# ---------------------------------------------------------------------------
+# _run_graphql over HTTPS
+# ---------------------------------------------------------------------------
+
+
+def _mock_client(handler) -> "httpx.Client":
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+@requires_httpx
+def test_run_graphql_posts_with_http_client(monkeypatch):
+    requests: list[httpx.Request] = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"data": {"viewer": {"login": "me"}}})
+
+    monkeypatch.setitem(sys.modules, "httpx", httpx)
+    monkeypatch.setattr(gh, "_graphql_client", lambda: _mock_client(handler))
+    calls = _stub_gh(monkeypatch, _OK_EMPTY)
+    data = gh._run_graphql("query($pr: Int!) { viewer { login } }", {"pr": 3})
+    assert calls == []
+    assert data["data"]["viewer"]["login"] == "me"
+    assert str(requests[0].url) == gh.GRAPHQL_URL
+    assert _json.loads(requests[0].content)["variables"] == {"pr": 3}
+
+
+@requires_httpx
+def test_run_graphql_http_error_status(monkeypatch):
+    def handler(request):
+        return httpx.Response(401, json={"message": "Bad credentials"})
+
+    monkeypatch.setitem(sys.modules, "httpx", httpx)
+    monkeypatch.setattr(gh, "_graphql_client", lambda: _mock_client(handler))
+    with pytest.raises(gh.GhError, match="HTTP 401"):
+        gh._run_graphql("query { viewer { login } }", {})
+
+
+@requires_httpx
+def test_run_graphql_transport_error(monkeypatch):
+    def handler(request):
+        raise httpx.ConnectError("connection refused")
+
+    monkeypatch.setitem(sys.modules, "httpx", httpx)
+    monkeypatch.setattr(gh, "_graphql_client", lambda: _mock_client(handler))
+    with pytest.raises(gh.GhError, match="connection refused"):
+        gh._run_graphql("query { viewer { login } }", {})
+
+
+@requires_httpx
+def test_graphql_client_uses_token(monkeypatch):
+    monkeypatch.setitem(sys.modules, "httpx", httpx)
+    monkeypatch.setenv("GH_TOKEN", "env-token")
+    client = gh._graphql_client()
+    assert client is gh._graphql_client()
+    assert client.headers["Authorization"] == "bearer env-token"
+
+
+def test_graphql_client_none_without_httpx():
+    assert gh._graphql_client() is None
+
+
+@requires_httpx
+def test_graphql_client_shared_across_queries(monkeypatch):
+    """Token lookup and client setup happen once; later queries reuse the pool."""
+    clients: list[httpx.Client] = []
+
+    def handler(request):
+        return httpx.Response(200, json={"data": {}})
+
+    class _RecordingClient(httpx.Client):
+        def __init__(self, **kwargs):
+            kwargs.pop("http2", None)
+            super().__init__(transport=httpx.MockTransport(handler), **kwargs)
+            clients.append(self)
+
+    monkeypatch.setitem(sys.modules, "httpx", httpx)
+    monkeypatch.setattr(httpx, "Client", _RecordingClient)
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    calls = _stub_gh(monkeypatch, _GH_AUTH_TOKEN)
+    gh.resolve_thread("t1")
+    gh.reply_to_thread("t1", "done")
+    assert len(calls) == 1
+    assert len(clients) == 1
+
+
+def test_gh_token_prefers_environment(monkeypatch):
+    monkeypatch.setenv("GH_TOKEN", "env-token")
+    calls = _stub_gh(monkeypatch, _OK_EMPTY)
+    assert gh._gh_token() == "env-token"
+    assert calls == []
+
+
+def test_gh_token_from_gh_auth(monkeypatch):
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    _stub_gh(monkeypatch, _GH_AUTH_TOKEN)
+    assert gh._gh_token() == "gho_abc"
+
+
+def test_gh_token_none_when_not_logged_in(monkeypatch):
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    _stub_gh(monkeypatch, _fake(returncode=1, stderr=b"not logged in"))
+    assert gh._gh_token() is None
 
 
 # ---------------------------------------------------------------------------
@@ -221,16 +444,21 @@ def test_run_graphql_raises_on_errors():
 # ---------------------------------------------------------------------------
 
 
-def test_run_command_nonzero_exit():
-    fake = subprocess.CompletedProcess(
-        args=[], returncode=1, stdout="", stderr="fatal: not a git repo"
-    )
-    with patch("subprocess.run", return_value=fake):
-        with pytest.raises(gh.GhError, match="not a git repo"):
-            gh._run_command(["git", "status"])
+def test_run_command_nonzero_exit(monkeypatch):
+    _stub_gh(monkeypatch, _fake(returncode=1, stderr=b"fatal: not a git repo"))
+    with pytest.raises(gh.GhError, match="not a git repo"):
+        gh._run_command(["git", "status"])
+
+
+def test_run_command_decodes_utf8(monkeypatch):
+    _stub_gh(monkeypatch, _fake(stdout="héllo ✔\n".encode()))
+    assert gh._run_command(["echo"]) == "héllo ✔\n"
+
 
+def test_run_command_not_found(monkeypatch):
+    def missing(*args, **kwargs):
+        raise FileNotFoundError
 
-def test_run_command_not_found():
-    with patch("subprocess.run", side_effect=FileNotFoundError):
-        with pytest.raises(typer.Exit):
-            gh._run_command(["nonexistent"])
+    monkeypatch.setattr(subprocess, "run", missing)
+    with pytest.raises(typer.Exit):
+        gh._run_command(["nonexistent"])
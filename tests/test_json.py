@@ -0,0 +1,41 @@
+"""Unit tests for hatchkit._json — orjson/stdlib JSON helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from hatchkit import _json
+
+_PAYLOAD = {"number": 7, "nodes": [{"body": "Fix this", "isResolved": False}]}
+_UNICODE_PAYLOAD = {"nodes": [{"body": "héllo ✔ — 修正してください"}]}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+def test_loads_accepts_str_and_bytes(backend):
+    text = json.dumps(_PAYLOAD)
+    assert _json.loads(text) == _PAYLOAD
+    assert _json.loads(text.encode()) == _PAYLOAD
+
+
+@pytest.mark.parametrize("payload", [_PAYLOAD, _UNICODE_PAYLOAD], ids=["ascii", "unicode"])
+def test_dumps_matches_stdlib_indent(backend, payload):
+    assert _json.dumps(payload) == json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("payload", [_PAYLOAD, _UNICODE_PAYLOAD], ids=["ascii", "unicode"])
+def test_dumpb_is_utf8_of_dumps(backend, payload):
+    assert _json.dumpb(payload) == _json.dumps(payload).encode("utf-8")
+
+
+def test_dumpb_writes_raw_utf8(backend):
+    assert "héllo ✔".encode() in _json.dumpb(_UNICODE_PAYLOAD)
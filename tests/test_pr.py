@@ -1,15 +1,23 @@
 """Integration tests for the hatchkit pr subcommands."""
 
-from __future__ import annotations
-
-import json
+import io
+import re
+from contextlib import ExitStack
+from typing import Any
 from unittest.mock import patch
 
-from typer.testing import CliRunner
+import pytest
+from typer.testing import CliRunner, Result
 
+from hatchkit import _json, pr
 from hatchkit.cli import app
+from hatchkit.pr import _json_out
+
 
-runner = CliRunner()
+@pytest.fixture(scope="module")
+def runner():
+    """One CliRunner for the module; it holds no state between invocations."""
+    return CliRunner()
 
 
 # ---------------------------------------------------------------------------
@@ -45,26 +53,103 @@ _THREADS = [
     },
 ]
 
+_RESOLVE_RESP = {"data": {"resolveReviewThread": {"thread": {"id": "T_abc", "isResolved": True}}}}
+
+_REPLY_RESP = {
+    "data": {"addPullRequestReviewThreadReply": {"comment": {"id": "c1", "body": "Fixed!"}}}
+}
+
+_CHECKS = [
+    {"name": "ci", "state": "completed", "conclusion": "SUCCESS", "link": "https://ci.example.com/1"}
+]
+
+_REPLY_AND_RESOLVE_RESP = {
+    "data": {
+        "addPullRequestReviewThreadReply": {"comment": {"id": "c1", "body": "Fixed!"}},
+        "resolveReviewThread": {"thread": {"id": "T_abc", "isResolved": True}},
+    }
+}
+
+# Expected JSON output, encoded once with the same helper the commands use.
+_PR_INFO_JSON = _json.dumpb(_PR_INFO) + b"\n"
+_THREADS_JSON = _json.dumpb(_THREADS) + b"\n"
+_CHECKS_JSON = _json.dumpb(_CHECKS) + b"\n"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _plain_console():
+    """Set NO_COLOR while this module runs.
+
+    Rich only reads it when a Console is built, so it affects consoles first
+    created here (such as the one ``pr`` prints tables with), not ones that
+    already exist.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("NO_COLOR", "1")
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _current_pr(monkeypatch):
+    """Pretend every command runs inside a checkout of PR #7 on a/b."""
+    monkeypatch.setattr("hatchkit.gh.get_repo_info", lambda: ("a", "b"))
+    monkeypatch.setattr("hatchkit.gh.get_pr_info", lambda: _PR_INFO)
+
+
+def _stdout_json(result: Result) -> Any:
+    """Parse a command's JSON output straight from the captured stdout bytes."""
+    return _json.loads(result.stdout_bytes)
+
+
+def _tokens_in(text: str, tokens: tuple[str, ...]) -> set[str]:
+    """Return which of *tokens* occur in *text*, found in one regex pass."""
+    # Longest first, so a token that prefixes another cannot shadow it.
+    alternatives = sorted(map(re.escape, tokens), key=len, reverse=True)
+    return set(re.findall("|".join(alternatives), text))
+
+
+def _captured_json(capsys) -> Any:
+    """Parse JSON written by a command function called without CliRunner.
+
+    Typer only fills in option defaults when it parses a command line, so
+    direct calls must pass every option explicitly.
+    """
+    return _json.loads(capsys.readouterr().out)
+
+
+# ---------------------------------------------------------------------------
+# _json_out
+# ---------------------------------------------------------------------------
+
+
+def test_json_out_without_binary_buffer(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr("sys.stdout", out)
+    _json_out({"number": 7})
+    assert _json.loads(out.getvalue()) == {"number": 7}
+
 
 # ---------------------------------------------------------------------------
 # pr info
 # ---------------------------------------------------------------------------
 
 
-def test_pr_info_json():
-    with patch("hatchkit.gh.get_pr_info", return_value=_PR_INFO):
-        result = runner.invoke(app, ["pr", "info"])
-    assert result.exit_code == 0
-    data = json.loads(result.output)
-    assert data["number"] == 7
+def _info_json(result: Result) -> None:
+    assert result.stdout_bytes == _PR_INFO_JSON
 
 
-def test_pr_info_pretty():
-    with patch("hatchkit.gh.get_pr_info", return_value=_PR_INFO):
-        result = runner.invoke(app, ["pr", "info", "--pretty"])
+def _info_pretty(result: Result) -> None:
+    assert "#7" in result.stdout
+    assert "feat/x" in result.stdout
+
+
+@pytest.mark.parametrize(
+    ("args", "check"), [([], _info_json), (["--pretty"], _info_pretty)], ids=["json", "pretty"]
+)
+def test_pr_info(args, check, runner):
+    result = runner.invoke(app, ["pr", "info", *args])
     assert result.exit_code == 0
-    assert "#7" in result.output
-    assert "feat/x" in result.output
+    check(result)
 
 
 # ---------------------------------------------------------------------------
@@ -72,63 +157,42 @@ def test_pr_info_pretty():
 # ---------------------------------------------------------------------------
 
 
-def test_pr_threads_json_unresolved_only():
+def test_pr_threads_json_unresolved_only(monkeypatch, capsys):
     unresolved = [t for t in _THREADS if not t["isResolved"]]
-    with (
-        patch("hatchkit.gh.get_repo_info", return_value=("a", "b")),
-        patch("hatchkit.gh.get_pr_info", return_value=_PR_INFO),
-        patch("hatchkit.gh.fetch_review_threads", return_value=unresolved),
-    ):
-        result = runner.invoke(app, ["pr", "threads"])
-    assert result.exit_code == 0
-    data = json.loads(result.output)
+    monkeypatch.setattr("hatchkit.gh.fetch_review_threads_full", lambda *a, **k: unresolved)
+    pr.threads(owner=None, repo=None, pr=None, all_threads=False, pretty=False)
+    data = _captured_json(capsys)
     assert len(data) == 1
     assert data[0]["id"] == "T_abc"
 
 
-def test_pr_threads_json_all():
-    with (
-        patch("hatchkit.gh.get_repo_info", return_value=("a", "b")),
-        patch("hatchkit.gh.get_pr_info", return_value=_PR_INFO),
-        patch("hatchkit.gh.fetch_review_threads", return_value=_THREADS),
-    ):
-        result = runner.invoke(app, ["pr", "threads", "--all"])
-    assert result.exit_code == 0
-    data = json.loads(result.output)
-    assert len(data) == 2
+def test_pr_threads_json_all(monkeypatch, capsysbinary):
+    monkeypatch.setattr("hatchkit.gh.fetch_review_threads_full", lambda *a, **k: _THREADS)
+    pr.threads(owner=None, repo=None, pr=None, all_threads=True, pretty=False)
+    assert capsysbinary.readouterr().out == _THREADS_JSON
 
 
-def test_pr_threads_explicit_owner_repo_pr():
+def test_pr_threads_explicit_owner_repo_pr(runner, monkeypatch):
     unresolved = [t for t in _THREADS if not t["isResolved"]]
-    with patch("hatchkit.gh.fetch_review_threads", return_value=unresolved):
-        result = runner.invoke(
-            app, ["pr", "threads", "--owner", "x", "--repo", "y", "--pr", "99"]
-        )
+    monkeypatch.setattr("hatchkit.gh.fetch_review_threads_full", lambda *a, **k: unresolved)
+    result = runner.invoke(app, ["pr", "threads", "--owner", "x", "--repo", "y", "--pr", "99"])
     assert result.exit_code == 0
-    data = json.loads(result.output)
+    data = _stdout_json(result)
     assert len(data) == 1
 
 
-def test_pr_threads_pretty():
+def test_pr_threads_pretty(runner, monkeypatch):
     unresolved = [t for t in _THREADS if not t["isResolved"]]
-    with (
-        patch("hatchkit.gh.get_repo_info", return_value=("a", "b")),
-        patch("hatchkit.gh.get_pr_info", return_value=_PR_INFO),
-        patch("hatchkit.gh.fetch_review_threads", return_value=unresolved),
-    ):
-        result = runner.invoke(app, ["pr", "threads", "--pretty"])
+    monkeypatch.setattr("hatchkit.gh.fetch_review_threads", lambda *a, **k: unresolved)
+    result = runner.invoke(app, ["pr", "threads", "--pretty"])
     assert result.exit_code == 0
-    assert "Review Threads" in result.output
-    assert "T_abc" in result.output
+    tokens = ("Review Threads", "T_abc")
+    assert _tokens_in(result.output, tokens) == set(tokens)
 
 
-def test_pr_threads_pretty_no_threads():
-    with (
-        patch("hatchkit.gh.get_repo_info", return_value=("a", "b")),
-        patch("hatchkit.gh.get_pr_info", return_value=_PR_INFO),
-        patch("hatchkit.gh.fetch_review_threads", return_value=[]),
-    ):
-        result = runner.invoke(app, ["pr", "threads", "--pretty"])
+def test_pr_threads_pretty_no_threads(runner, monkeypatch):
+    monkeypatch.setattr("hatchkit.gh.fetch_review_threads", lambda *a, **k: [])
+    result = runner.invoke(app, ["pr", "threads", "--pretty"])
     assert result.exit_code == 0
     assert "No unresolved threads" in result.output
 
@@ -138,83 +202,128 @@ def test_pr_threads_pretty_no_threads():
 # ---------------------------------------------------------------------------
 
 
-def test_pr_resolve_json():
-    resolve_resp = {
-        "data": {"resolveReviewThread": {"thread": {"id": "T_abc", "isResolved": True}}}
-    }
-    with patch("hatchkit.gh.resolve_thread", return_value=resolve_resp):
-        result = runner.invoke(app, ["pr", "resolve", "T_abc"])
-    assert result.exit_code == 0
-    data = json.loads(result.output)
+def _resolve_json(result: Result) -> None:
+    data = _stdout_json(result)
     assert data["data"]["resolveReviewThread"]["thread"]["isResolved"] is True
 
 
-def test_pr_resolve_pretty():
-    resolve_resp = {
-        "data": {"resolveReviewThread": {"thread": {"id": "T_abc", "isResolved": True}}}
-    }
-    with patch("hatchkit.gh.resolve_thread", return_value=resolve_resp):
-        result = runner.invoke(app, ["pr", "resolve", "T_abc", "--pretty"])
+def _resolve_pretty(result: Result) -> None:
+    assert "Resolved thread" in result.stdout
+
+
+@pytest.mark.parametrize(
+    ("args", "check"),
+    [([], _resolve_json), (["--pretty"], _resolve_pretty)],
+    ids=["json", "pretty"],
+)
+def test_pr_resolve(args, check, runner, monkeypatch):
+    monkeypatch.setattr("hatchkit.gh.resolve_thread", lambda *a, **k: _RESOLVE_RESP)
+    result = runner.invoke(app, ["pr", "resolve", "T_abc", *args])
     assert result.exit_code == 0
-    assert "Resolved thread" in result.output
+    check(result)
 
 
 # ---------------------------------------------------------------------------
-# pr reply
+# pr resolve-all
 # ---------------------------------------------------------------------------
 
-
-def test_pr_reply_json():
-    reply_resp = {
-        "data": {"addPullRequestReviewThreadReply": {"comment": {"id": "c1", "body": "Fixed!"}}}
+_RESOLVE_ALL_RESP = {
+    "data": {
+        "r0": {"thread": {"id": "T_abc", "isResolved": True}},
+        "r1": {"thread": {"id": "T_xyz", "isResolved": True}},
     }
-    with patch("hatchkit.gh.reply_to_thread", return_value=reply_resp):
-        result = runner.invoke(app, ["pr", "reply", "T_abc", "Fixed!"])
+}
+
+
+def test_pr_resolve_all_ids_json(runner):
+    with patch("hatchkit.gh.resolve_threads", return_value=_RESOLVE_ALL_RESP) as resolve:
+        result = runner.invoke(app, ["pr", "resolve-all", "T_abc", "T_xyz"])
     assert result.exit_code == 0
-    data = json.loads(result.output)
-    assert "reply" in data
+    resolve.assert_called_once_with(["T_abc", "T_xyz"])
+    data = _stdout_json(result)
+    assert data["data"]["r1"]["thread"]["id"] == "T_xyz"
 
 
-def test_pr_reply_with_resolve():
-    reply_resp = {
-        "data": {"addPullRequestReviewThreadReply": {"comment": {"id": "c1", "body": "Fixed!"}}}
-    }
-    resolve_resp = {
-        "data": {"resolveReviewThread": {"thread": {"id": "T_abc", "isResolved": True}}}
-    }
+def test_pr_resolve_all_unresolved_pretty(runner):
+    unresolved = [t for t in _THREADS if not t["isResolved"]]
     with (
-        patch("hatchkit.gh.reply_to_thread", return_value=reply_resp),
-        patch("hatchkit.gh.resolve_thread", return_value=resolve_resp),
+        patch("hatchkit.gh.fetch_review_threads", return_value=unresolved) as fetch,
+        patch("hatchkit.gh.resolve_threads", return_value=_RESOLVE_ALL_RESP) as resolve,
     ):
-        result = runner.invoke(app, ["pr", "reply", "T_abc", "Fixed!", "--resolve"])
+        result = runner.invoke(app, ["pr", "resolve-all", "--all-unresolved", "--pretty"])
     assert result.exit_code == 0
-    data = json.loads(result.output)
-    assert "reply" in data
-    assert "resolve" in data
+    fetch.assert_called_once_with("a", "b", 7)
+    resolve.assert_called_once_with(["T_abc"])
+    assert "Resolved thread" in result.output
+    assert "T_abc" in result.output
 
 
-def test_pr_reply_pretty():
-    reply_resp = {
-        "data": {"addPullRequestReviewThreadReply": {"comment": {"id": "c1", "body": "Fixed!"}}}
-    }
-    with patch("hatchkit.gh.reply_to_thread", return_value=reply_resp):
-        result = runner.invoke(app, ["pr", "reply", "T_abc", "Fixed!", "--pretty"])
+def test_pr_resolve_all_dedupes_ids_with_unresolved(runner):
+    unresolved = [t for t in _THREADS if not t["isResolved"]]
+    with (
+        patch("hatchkit.gh.fetch_review_threads", return_value=unresolved),
+        patch("hatchkit.gh.resolve_threads", return_value=_RESOLVE_ALL_RESP) as resolve,
+    ):
+        result = runner.invoke(
+            app, ["pr", "resolve-all", "T_xyz", "T_abc", "T_xyz", "--all-unresolved"]
+        )
     assert result.exit_code == 0
-    assert "Replied to thread" in result.output
+    resolve.assert_called_once_with(["T_xyz", "T_abc"])
 
 
-def test_pr_reply_pretty_with_resolve():
-    reply_resp = {
-        "data": {"addPullRequestReviewThreadReply": {"comment": {"id": "c1", "body": "Fixed!"}}}
-    }
-    resolve_resp = {
-        "data": {"resolveReviewThread": {"thread": {"id": "T_abc", "isResolved": True}}}
-    }
-    with (
-        patch("hatchkit.gh.reply_to_thread", return_value=reply_resp),
-        patch("hatchkit.gh.resolve_thread", return_value=resolve_resp),
-    ):
-        result = runner.invoke(app, ["pr", "reply", "T_abc", "Fixed!", "--resolve", "--pretty"])
+def test_pr_resolve_all_requires_ids(runner):
+    with patch("hatchkit.gh.resolve_threads") as resolve:
+        result = runner.invoke(app, ["pr", "resolve-all"])
+    assert result.exit_code == 1
+    resolve.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# pr reply
+# ---------------------------------------------------------------------------
+
+
+def _reply_json(result: Result) -> None:
+    assert "reply" in _stdout_json(result)
+
+
+def _reply_pretty(result: Result) -> None:
+    assert "Replied to thread" in result.stdout
+
+
+@pytest.mark.parametrize(
+    ("args", "check"), [([], _reply_json), (["--pretty"], _reply_pretty)], ids=["json", "pretty"]
+)
+def test_pr_reply(args, check, runner, monkeypatch):
+    monkeypatch.setattr("hatchkit.gh.reply_to_thread", lambda *a, **k: _REPLY_RESP)
+    result = runner.invoke(app, ["pr", "reply", "T_abc", "Fixed!", *args])
+    assert result.exit_code == 0
+    check(result)
+
+
+@pytest.fixture
+def reply_and_resolve():
+    """Patch the combined reply+resolve call; the two-request path must stay unused."""
+    unused = AssertionError("--resolve should use a single combined request")
+    with ExitStack() as stack:
+        combined = stack.enter_context(
+            patch("hatchkit.gh.reply_and_resolve_thread", return_value=_REPLY_AND_RESOLVE_RESP)
+        )
+        stack.enter_context(patch("hatchkit.gh.reply_to_thread", side_effect=unused))
+        stack.enter_context(patch("hatchkit.gh.resolve_thread", side_effect=unused))
+        yield combined
+
+
+def test_pr_reply_with_resolve(reply_and_resolve, capsys):
+    pr.reply("T_abc", "Fixed!", resolve_thread=True, pretty=False)
+    reply_and_resolve.assert_called_once_with("T_abc", "Fixed!")
+    data = _captured_json(capsys)
+    assert data["reply"]["data"]["addPullRequestReviewThreadReply"]["comment"]["id"] == "c1"
+    assert data["resolve"]["data"]["resolveReviewThread"]["thread"]["isResolved"] is True
+
+
+def test_pr_reply_pretty_with_resolve(runner, reply_and_resolve):
+    result = runner.invoke(app, ["pr", "reply", "T_abc", "Fixed!", "--resolve", "--pretty"])
     assert result.exit_code == 0
     assert "Replied to thread" in result.output
     assert "Resolved thread" in result.output
@@ -225,31 +334,28 @@ def test_pr_reply_pretty_with_resolve():
 # ---------------------------------------------------------------------------
 
 
-def test_pr_checks_json():
-    checks_data = [
-        {"name": "ci", "state": "completed", "conclusion": "success", "link": "https://ci.example.com/1"}
-    ]
-    with patch("hatchkit.gh.get_pr_checks", return_value=checks_data):
-        result = runner.invoke(app, ["pr", "checks"])
-    assert result.exit_code == 0
-    data = json.loads(result.output)
-    assert data[0]["name"] == "ci"
+def _checks_json(result: Result) -> None:
+    assert result.stdout_bytes == _CHECKS_JSON
 
 
-def test_pr_checks_pretty():
-    checks_data = [
-        {"name": "ci", "state": "completed", "conclusion": "SUCCESS", "link": "https://ci.example.com/1"}
-    ]
-    with patch("hatchkit.gh.get_pr_checks", return_value=checks_data):
-        result = runner.invoke(app, ["pr", "checks", "--pretty"])
+def _checks_pretty(result: Result) -> None:
+    tokens = ("PR Checks", "ci")
+    assert _tokens_in(result.stdout, tokens) == set(tokens)
+
+
+@pytest.mark.parametrize(
+    ("args", "check"), [([], _checks_json), (["--pretty"], _checks_pretty)], ids=["json", "pretty"]
+)
+def test_pr_checks(args, check, runner, monkeypatch):
+    monkeypatch.setattr("hatchkit.gh.get_pr_checks", lambda *a, **k: _CHECKS)
+    result = runner.invoke(app, ["pr", "checks", *args])
     assert result.exit_code == 0
-    assert "PR Checks" in result.output
-    assert "ci" in result.output
+    check(result)
 
 
-def test_pr_checks_pretty_no_checks():
-    with patch("hatchkit.gh.get_pr_checks", return_value=[]):
-        result = runner.invoke(app, ["pr", "checks", "--pretty"])
+def test_pr_checks_pretty_no_checks(runner, monkeypatch):
+    monkeypatch.setattr("hatchkit.gh.get_pr_checks", lambda *a, **k: [])
+    result = runner.invoke(app, ["pr", "checks", "--pretty"])
     assert result.exit_code == 0
     assert "No checks found" in result.output
 
@@ -259,11 +365,16 @@ def test_pr_checks_pretty_no_checks():
 # ---------------------------------------------------------------------------
 
 
-def test_pr_help():
-    result = runner.invoke(app, ["pr", "--help"])
+@pytest.fixture(scope="session")
+def pr_help_output():
+    """Render ``hatchkit pr --help`` once; it is static for the whole session."""
+    result = CliRunner().invoke(app, ["pr", "--help"])
     assert result.exit_code == 0
-    assert "threads" in result.output
-    assert "resolve" in result.output
-    assert "reply" in result.output
-    assert "checks" in result.output
-    assert "info" in result.output
+    return result.output
+
+
+_HELP_TOKENS = ("threads", "resolve", "reply", "checks", "info")
+
+
+def test_pr_help(pr_help_output):
+    assert _tokens_in(pr_help_output, _HELP_TOKENS) == set(_HELP_TOKENS)